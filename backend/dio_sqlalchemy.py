@@ -1,8 +1,3 @@
-import os
-
-from sqlalchemy import Table, MetaData, Column, ForeignKey, Integer, String, create_engine, Boolean
-from sqlalchemy.orm import mapper, sessionmaker, relationship
-
 from diopy.client.models import DiopyClient
 from diopy.resources.models import Droplet, Region, Size, Image
 
@@ -11,7 +6,13 @@ def setup_backend(config=None):
     Requires the config to contain the following:
         'Database' settings block with:
             - file: The path to the database file, if not provided an in-memory sqlite dabatase will be used.
+
+    SQLAlchemy is imported here rather than at module level, so processes that never set up a backend
+    don't pay for loading the ORM.
     """
+    from sqlalchemy import Table, MetaData, Column, ForeignKey, Integer, String, create_engine, Boolean
+    from sqlalchemy.orm import mapper, sessionmaker, relationship
+
     db_file_path = config['Database'].get('file_path', None)
     if not db_file_path:
         db_file_path = ":memory:"
@@ -1,12 +1,8 @@
 from requests import get
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy import Column, Integer, String
 
 from diopy.resources.models import Region, Size, SSHKey, Droplet, Image, Event
 from diopy.resources.settings import OK_STATUS, DO_URL
 
-Base = declarative_base()
-
 
 def get_api_url(requested_item_type):
     """Get the correct digital ocean api url for a specific type of items."""
@@ -0,0 +1,163 @@
+class PlacementRequest():
+    """A request for a new droplet, described by its requirements instead of concrete ids.
+
+    :param string name: The name of the droplet.
+
+    :param string image_slug: The slug of the image used to create the droplet.
+
+    :param int min_cpu: The minimal amount of cpu cores.
+
+    :param int min_memory: The minimal amount of memory in MB.
+
+    :param int min_disk: The minimal disk size in GB.
+
+    :param [string] region_slugs: The slugs of the allowed regions, all regions are allowed if not provided.
+
+    :param float max_cost_per_month: The monthly budget for the droplet, unlimited if not provided.
+
+    :param [int] ssh_key_ids: A list with SSHKey ids, which will be added to the created droplet.
+
+    """
+    def __init__(self,
+                 name,
+                 image_slug,
+                 min_cpu=0,
+                 min_memory=0,
+                 min_disk=0,
+                 region_slugs=None,
+                 max_cost_per_month=None,
+                 ssh_key_ids=[],
+                 private_networking=False,
+                 backups_enabled=False):
+        self.name = name
+        self.image_slug = image_slug
+        self.min_cpu = min_cpu
+        self.min_memory = min_memory
+        self.min_disk = min_disk
+        self.region_slugs = region_slugs
+        self.max_cost_per_month = max_cost_per_month
+        self.ssh_key_ids = ssh_key_ids
+        self.private_networking = private_networking
+        self.backups_enabled = backups_enabled
+
+    def __repr__(self):
+        return "<PlacementRequest {name}: {image_slug}>".format(name=self.name, image_slug=self.image_slug)
+
+    def fits(self, size):
+        """Returns True if the given size meets the requirements and the budget of this request."""
+        if float(size.cpu) < self.min_cpu:
+            return False
+        if float(size.memory) < self.min_memory:
+            return False
+        if float(size.disk) < self.min_disk:
+            return False
+        if self.max_cost_per_month is not None and float(size.cost_per_month) > self.max_cost_per_month:
+            return False
+        return True
+
+
+class PlacementPlanner():
+    """Chooses the size, region and image for new droplets from the catalog cached by a DiopyClient.
+
+    The planner keeps availability indexes (image -> regions, region -> sizes sorted by cost) which are
+    only rebuilt for the parts of the catalog the client has refreshed since the last plan.
+
+    """
+    def __init__(self, client):
+        self.client = client
+        self._indexed_images = None
+        self._indexed_regions = None
+        self._indexed_sizes = None
+        self._sizes_by_cost = []
+        self._regions_by_id = {}
+        self._region_sizes = {}
+        self._image_regions = {}
+        self._images_by_slug = {}
+
+    def refresh(self):
+        """Update the availability indexes for every catalog list the client has replaced."""
+        images = self.client.images()
+        regions = self.client.regions()
+        sizes = self.client.sizes()
+
+        sizes_changed = sizes is not self._indexed_sizes
+        regions_changed = regions is not self._indexed_regions
+
+        if sizes_changed:
+            self._sizes_by_cost = sorted(sizes, key=lambda size: float(size.cost_per_month))
+            self._indexed_sizes = sizes
+
+        if regions_changed:
+            self._regions_by_id = dict((region.region_id, region) for region in regions)
+            self._indexed_regions = regions
+
+        if sizes_changed or regions_changed:
+            # Every size is available in every region in the current API.
+            self._region_sizes = dict(
+                (region_id, self._sizes_by_cost) for region_id in self._regions_by_id
+            )
+
+        if regions_changed or images is not self._indexed_images:
+            self._index_images(images)
+            self._indexed_images = images
+
+    def _index_images(self, images):
+        """Build the image slug -> region ids index, using both the region ids and slugs of the images."""
+        region_ids_by_slug = dict((region.slug, region.region_id) for region in self._regions_by_id.values())
+
+        self._images_by_slug = {}
+        self._image_regions = {}
+        for image in images:
+            if not image.slug:
+                continue
+            region_ids = set(region_id for region_id in image.regions or [] if region_id in self._regions_by_id)
+            region_ids.update(
+                region_ids_by_slug[slug] for slug in image.region_slugs or [] if slug in region_ids_by_slug
+            )
+            self._images_by_slug[image.slug] = image
+            self._image_regions[image.slug] = region_ids
+
+    def plan(self, placement_requests):
+        """Returns the new_droplet_with_ids arguments for each of the given PlacementRequests, in the same order.
+        The cheapest size fitting the request is used, None is returned for requests which can't be placed.
+
+        :param [PlacementRequest] placement_requests: The requests to place.
+
+        """
+        self.refresh()
+        return [self._place(placement_request) for placement_request in placement_requests]
+
+    def _place(self, placement_request):
+        """Returns the new_droplet_with_ids arguments for a single PlacementRequest, or None."""
+        image = self._images_by_slug.get(placement_request.image_slug)
+        if image is None:
+            return None
+
+        region_ids = self._image_regions[image.slug]
+        if placement_request.region_slugs is not None:
+            allowed_slugs = set(placement_request.region_slugs)
+            region_ids = [
+                region_id for region_id in region_ids if self._regions_by_id[region_id].slug in allowed_slugs
+            ]
+
+        best_size, best_region_id = None, None
+        for region_id in sorted(region_ids):
+            for size in self._region_sizes.get(region_id, []):
+                if best_size is not None and float(size.cost_per_month) >= float(best_size.cost_per_month):
+                    break
+                if placement_request.fits(size):
+                    best_size, best_region_id = size, region_id
+                    break
+
+        if best_size is None:
+            return None
+
+        return {
+            'name': placement_request.name,
+            'size_id': best_size.size_id,
+            'image_id': image.image_id,
+            'region_id': best_region_id,
+            'ssh_key_ids': placement_request.ssh_key_ids,
+            'private_networking': placement_request.private_networking,
+            'backups_enabled': placement_request.backups_enabled,
+        }
@@ -0,0 +1,48 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Heavy dependencies which must not be loaded on the plain 'list droplets' path. Checking for the modules
+# themselves is the cold-start guard: loading any of them costs far more than the rest of the client.
+HEAVY_MODULES = ["sqlalchemy"]
+
+COLD_START_SCRIPT = """
+import sys
+
+import diopy.client.models
+from diopy.client.models import DiopyClient
+
+
+class StubResponse():
+    status_code = 200
+
+    def json(self):
+        return {"status": "OK", "droplets": []}
+
+
+diopy.client.models.get = lambda url, params=None: StubResponse()
+
+client = DiopyClient(client_id='test', api_key='test')
+client.droplets()
+
+for module_name in sys.argv[1:]:
+    print(module_name in sys.modules)
+"""
+
+
+@pytest.fixture(scope="module")
+def loaded_heavy_modules():
+    """List droplets in a fresh interpreter, with the API request stubbed.
+    Returns the names of the heavy modules that got loaded.
+
+    """
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(path for path in sys.path if path))
+    output = subprocess.check_output([sys.executable, "-c", COLD_START_SCRIPT] + HEAVY_MODULES, env=env)
+    loaded = output.decode().split()
+    return [module_name for module_name, is_loaded in zip(HEAVY_MODULES, loaded) if is_loaded == "True"]
+
+
+def test_list_droplets_does_not_load_heavy_modules(loaded_heavy_modules):
+    assert loaded_heavy_modules == []
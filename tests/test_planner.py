@@ -0,0 +1,89 @@
+import pytest
+
+from diopy.client.models import DiopyClient
+from diopy.client.planner import PlacementPlanner, PlacementRequest
+from diopy.resources.models import Region, Size, Image
+
+
+@pytest.fixture
+def catalog_client():
+    """Create a test diopy client with a cached catalog, so no API requests are made."""
+    client = DiopyClient(client_id='test', api_key='test')
+    client._regions = [
+        Region(region_id=1, name="New York 1", slug="nyc1"),
+        Region(region_id=2, name="Amsterdam 1", slug="ams1"),
+    ]
+    client._sizes = [
+        Size(size_id=62, cpu=2, name="2GB", slug="2gb", disk=40, memory=2048, cost_per_hour=0.03,
+             cost_per_month=20.0),
+        Size(size_id=66, cpu=1, name="512MB", slug="512mb", disk=20, memory=512, cost_per_hour=0.007,
+             cost_per_month=5.0),
+        Size(size_id=63, cpu=1, name="1GB", slug="1gb", disk=30, memory=1024, cost_per_hour=0.015,
+             cost_per_month=10.0),
+    ]
+    client._images = [
+        Image(image_id=350076, name="Ubuntu 13.04 x64", slug="ubuntu-13-04-x64", public=True, regions=[1],
+              distribution="Ubuntu", region_slugs=["ams1"]),
+        Image(image_id=1601, name="CentOS 5.8 x64", slug="centos-5-8-x64", public=True, regions=[2],
+              distribution="CentOS", region_slugs=["ams1"]),
+    ]
+    return client
+
+
+def test_plan_picks_cheapest_fitting_size(catalog_client):
+    planner = PlacementPlanner(catalog_client)
+    placements = planner.plan([
+        PlacementRequest(name="small", image_slug="ubuntu-13-04-x64"),
+        PlacementRequest(name="big", image_slug="centos-5-8-x64", min_memory=1500),
+    ])
+
+    assert placements[0]['size_id'] == 66
+    assert placements[0]['image_id'] == 350076
+    assert placements[0]['region_id'] == 1
+    assert placements[1]['size_id'] == 62
+    assert placements[1]['region_id'] == 2
+
+
+def test_plan_respects_regions_and_budget(catalog_client):
+    planner = PlacementPlanner(catalog_client)
+    placements = planner.plan([
+        PlacementRequest(name="nyc", image_slug="ubuntu-13-04-x64", region_slugs=["nyc1"]),
+        PlacementRequest(name="nowhere", image_slug="centos-5-8-x64", region_slugs=["nyc1"]),
+        PlacementRequest(name="too-expensive", image_slug="ubuntu-13-04-x64", min_cpu=2, max_cost_per_month=10),
+        PlacementRequest(name="unknown", image_slug="arch"),
+    ])
+
+    assert placements[0]['region_id'] == 1
+    assert placements[1:] == [None, None, None]
+
+
+def test_plan_refreshes_changed_catalog(catalog_client):
+    planner = PlacementPlanner(catalog_client)
+    assert planner.plan([PlacementRequest(name="small", image_slug="ubuntu-13-04-x64")])[0]['size_id'] == 66
+
+    catalog_client._sizes = [size for size in catalog_client._sizes if size.size_id != 66]
+    assert planner.plan([PlacementRequest(name="small", image_slug="ubuntu-13-04-x64")])[0]['size_id'] == 63
+
+
+def test_plan_refreshes_changed_regions(catalog_client):
+    planner = PlacementPlanner(catalog_client)
+    assert planner.plan([PlacementRequest(name="ams", image_slug="centos-5-8-x64")])[0]['region_id'] == 2
+
+    catalog_client._regions = [
+        Region(region_id=1, name="New York 1", slug="nyc1"),
+        Region(region_id=3, name="Amsterdam 1", slug="ams1"),
+    ]
+    assert planner.plan([PlacementRequest(name="ams", image_slug="centos-5-8-x64")])[0]['region_id'] == 3
+
+
+def test_plan_refreshes_changed_images(catalog_client):
+    planner = PlacementPlanner(catalog_client)
+    assert planner.plan([PlacementRequest(name="arch", image_slug="arch")]) == [None]
+
+    catalog_client._images = catalog_client._images + [
+        Image(image_id=2000, name="Arch Linux", slug="arch", public=True, regions=[], distribution="Arch",
+              region_slugs=["nyc1"]),
+    ]
+    placement = planner.plan([PlacementRequest(name="arch", image_slug="arch")])[0]
+    assert placement['image_id'] == 2000
+    assert placement['region_id'] == 1